@@ -0,0 +1,160 @@
+"""
+Numba-compiled negamax search for 3x3 Tic-Tac-Toe.
+
+Positions use the same (x_bb, o_bb) bitboard pair as TicTacToe, passed as
+two plain integers so the whole recursion stays in native code. Numba is
+optional: without it the functions below run as ordinary Python, and
+MinimaxAgent only switches to them when NUMBA_AVAILABLE is True.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Rows, columns and diagonals of a 3x3 board, bit = row * 3 + col
+WIN_MASKS = np.array([0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124], dtype=np.int64)
+FULL_MASK = 0o777
+# Cells in search order: centre, corners, then edges
+MOVE_BITS = np.array([1 << cell for cell in (4, 0, 2, 6, 8, 1, 3, 5, 7)], dtype=np.int64)
+WIN_SCORE = 1000.0
+# Root plus one ply per cell
+MAX_PLY = 10
+
+
+@njit(cache=True)
+def popcount(bb):
+    """Return the number of set bits in a bitboard."""
+    count = 0
+    while bb:
+        bb &= bb - 1
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def is_win(bb):
+    """Return True if the bitboard covers a complete line."""
+    for i in range(WIN_MASKS.shape[0]):
+        mask = WIN_MASKS[i]
+        if bb & mask == mask:
+            return True
+    return False
+
+
+@njit(cache=True)
+def evaluate(x_bb, o_bb, player):
+    """Same line-counting heuristic as TicTacToe.evaluate, from player's perspective."""
+    if player == 1:
+        own, opp = x_bb, o_bb
+    else:
+        own, opp = o_bb, x_bb
+
+    score = 0
+    for i in range(WIN_MASKS.shape[0]):
+        mask = WIN_MASKS[i]
+        own_line = own & mask
+        opp_line = opp & mask
+        if opp_line == 0:
+            score += 10 ** popcount(own_line)
+        if own_line == 0:
+            score -= 10 ** popcount(opp_line)
+    return float(score)
+
+
+@njit(cache=True)
+def negamax(x_bb, o_bb, player, depth, alpha, beta, nodes):
+    """
+    Alpha-beta negamax search.
+
+    The recursion is unrolled onto explicit per-ply arrays because Numba
+    cannot load self-recursive functions back from its on-disk cache.
+
+    Args:
+        x_bb: Bitboard of X's marks
+        o_bb: Bitboard of O's marks
+        player: Player to move (1 for X, -1 for O)
+        depth: Remaining search depth
+        alpha: Lower bound of the search window
+        beta: Upper bound of the search window
+        nodes: One-element int64 array incremented once per node searched
+
+    Returns:
+        The value of the position from the perspective of the player to move
+    """
+    x_stack = np.empty(MAX_PLY, dtype=np.int64)
+    o_stack = np.empty(MAX_PLY, dtype=np.int64)
+    players = np.empty(MAX_PLY, dtype=np.int64)
+    frees = np.empty(MAX_PLY, dtype=np.int64)
+    alphas = np.empty(MAX_PLY, dtype=np.float64)
+    betas = np.empty(MAX_PLY, dtype=np.float64)
+    values = np.empty(MAX_PLY, dtype=np.float64)
+
+    ply = 0
+    x_stack[0] = x_bb
+    o_stack[0] = o_bb
+    players[0] = player
+    alphas[0] = alpha
+    betas[0] = beta
+
+    while True:
+        nodes[0] += 1
+        x = x_stack[ply]
+        o = o_stack[ply]
+        done = True
+
+        # Only the player who just moved can have completed a line
+        if is_win(x) or is_win(o):
+            result = -WIN_SCORE
+        elif (x | o) == FULL_MASK:
+            result = 0.0
+        elif ply >= depth:
+            result = evaluate(x, o, players[ply])
+        else:
+            result = 0.0
+            frees[ply] = ~(x | o) & FULL_MASK
+            values[ply] = -np.inf
+            done = False
+
+        if done:
+            # Hand the result back up until a node still has children to try
+            while True:
+                if ply == 0:
+                    return result
+                ply -= 1
+                score = -result
+                if score > values[ply]:
+                    values[ply] = score
+                if values[ply] > alphas[ply]:
+                    alphas[ply] = values[ply]
+                if alphas[ply] < betas[ply] and frees[ply] != 0:
+                    break
+                result = values[ply]  # Cutoff or all children searched
+
+        # Descend into the next empty cell of the node at ply
+        free = frees[ply]
+        bit = 0
+        for k in range(MOVE_BITS.shape[0]):
+            bit = MOVE_BITS[k]
+            if free & bit:
+                break
+        frees[ply] = free ^ bit
+        if players[ply] == 1:
+            x_stack[ply + 1] = x_stack[ply] | bit
+            o_stack[ply + 1] = o_stack[ply]
+        else:
+            x_stack[ply + 1] = x_stack[ply]
+            o_stack[ply + 1] = o_stack[ply] | bit
+        players[ply + 1] = -players[ply]
+        alphas[ply + 1] = -betas[ply]
+        betas[ply + 1] = -alphas[ply]
+        ply += 1
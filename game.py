@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional, Any
+from typing import Sequence, Tuple, Optional, Any
 
 
 class Game(ABC):
@@ -11,8 +11,8 @@ class Game(ABC):
         pass
     
     @abstractmethod
-    def get_legal_moves(self, state: Any) -> List[Any]:
-        """Return a list of legal moves from the given state."""
+    def get_legal_moves(self, state: Any) -> Sequence[Any]:
+        """Return a sequence of legal moves from the given state."""
         pass
     
     @abstractmethod
@@ -32,10 +32,29 @@ class Game(ABC):
     
     @abstractmethod
     def evaluate(self, state: Any, player: int) -> float:
-        """Return a heuristic evaluation of the given state from the perspective of the specified player."""
+        """
+        Return a heuristic evaluation of the given state from the perspective of the specified player.
+        
+        The search scores leaves from the side to move, so the evaluation must be
+        zero-sum: evaluate(state, -player) == -evaluate(state, player).
+        """
         pass
     
     @abstractmethod
     def print_state(self, state: Any) -> None:
         """Print a human-readable representation of the state."""
-        pass
\ No newline at end of file
+        pass
+    
+    def get_canonical_state(self, state: Any) -> Tuple[Any, int]:
+        """
+        Return (canonical state, symmetry) for the given state.
+        
+        Games with board symmetries can override this so that equivalent
+        states share one canonical representative; symmetry identifies the
+        transform that maps the state onto it. By default there are none.
+        """
+        return state, 0
+    
+    def transform_move(self, move: Any, symmetry: int, inverse: bool = False) -> Any:
+        """Map a move through a symmetry from get_canonical_state, or back through its inverse."""
+        return move
\ No newline at end of file
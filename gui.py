@@ -1,10 +1,12 @@
 import pygame
 import sys
 import numpy as np
-import time
 from tictactoe import TicTacToe
 from minimax_agent import MinimaxAgent
 
+# Posted by a one-shot timer when it is time for the AI to move
+AI_MOVE_EVENT = pygame.USEREVENT + 1
+
 class TicTacToeGUI:
     # Colors
     WHITE = (255, 255, 255)
@@ -28,6 +30,7 @@ class TicTacToeGUI:
     CIRCLE_WIDTH = 15
     CROSS_WIDTH = 25
     SPACE = SQUARE_SIZE // 4
+    AI_MOVE_DELAY_MS = 500
     
     def __init__(self, ai_depth=5, player_first=True):
         """
@@ -41,7 +44,19 @@ class TicTacToeGUI:
         pygame.init()
         self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
         pygame.display.set_caption('Tic Tac Toe with Minimax AI')
-        self.screen.fill(self.BG_COLOR)
+        
+        # Background and grid never change, so render them once off-screen
+        self._board_surface = pygame.Surface((self.WIDTH, self.HEIGHT))
+        self._board_surface.fill(self.BG_COLOR)
+        self.draw_lines(self._board_surface)
+        
+        # Fonts and result messages are rendered once, not on every redraw
+        self._font_title = pygame.font.SysFont(None, 60, bold=True)
+        self._font_restart = pygame.font.SysFont(None, 36)
+        self._surf_win = self._font_title.render("You Won!", True, self.GREEN)
+        self._surf_loss = self._font_title.render("AI Won!", True, self.RED)
+        self._surf_draw = self._font_title.render("It's a Draw!", True, self.BLACK)
+        self._surf_restart = self._font_restart.render("Press R to restart or Q to quit", True, self.DARK_BLUE)
         
         # Game state
         self.game = TicTacToe()
@@ -57,19 +72,19 @@ class TicTacToeGUI:
         self.game_over = False
         self.winner = None
         
-        # Draw initial board
-        self.draw_lines()
+        # Set whenever the screen needs to be redrawn
+        self.dirty = True
         
         # AI makes first move if player is second
         if not player_first:
-            self.ai_make_move()
+            self.schedule_ai_move()
     
-    def draw_lines(self):
-        """Draw the board lines"""
+    def draw_lines(self, surface):
+        """Draw the board lines onto the given surface"""
         # Horizontal lines
         for i in range(1, self.BOARD_ROWS):
             pygame.draw.line(
-                self.screen, self.BLACK, 
+                surface, self.BLACK, 
                 (0, i * self.SQUARE_SIZE), 
                 (self.WIDTH, i * self.SQUARE_SIZE), 
                 self.LINE_WIDTH
@@ -78,7 +93,7 @@ class TicTacToeGUI:
         # Vertical lines
         for i in range(1, self.BOARD_COLS):
             pygame.draw.line(
-                self.screen, self.BLACK, 
+                surface, self.BLACK, 
                 (i * self.SQUARE_SIZE, 0), 
                 (i * self.SQUARE_SIZE, self.HEIGHT), 
                 self.LINE_WIDTH
@@ -90,8 +105,9 @@ class TicTacToeGUI:
             for col in range(self.BOARD_COLS):
                 center_x = col * self.SQUARE_SIZE + self.SQUARE_SIZE // 2
                 center_y = row * self.SQUARE_SIZE + self.SQUARE_SIZE // 2
+                cell = self.game.get_cell(self.state, row, col)
                 
-                if self.state[row, col] == 1:  # X
+                if cell == 1:  # X
                     # Draw X
                     pygame.draw.line(
                         self.screen, self.RED,
@@ -105,7 +121,7 @@ class TicTacToeGUI:
                         (center_x - self.SPACE, center_y + self.SPACE),
                         self.CROSS_WIDTH
                     )
-                elif self.state[row, col] == -1:  # O
+                elif cell == -1:  # O
                     # Draw O
                     pygame.draw.circle(
                         self.screen, self.BLUE,
@@ -118,43 +134,44 @@ class TicTacToeGUI:
         """Handle player's click on a cell"""
         if not self.game_over and self.current_player == self.player_symbol:
             # Check if the cell is empty
-            if self.state[row, col] == 0:
+            if self.game.get_cell(self.state, row, col) == 0:
                 # Make the move
                 self.state = self.game.get_next_state(self.state, (row, col))
                 self.current_player = -self.current_player
+                self.dirty = True
                 
                 # Check if game is over
                 self.check_game_over()
                 
-                # Draw the updated board
-                self.draw_figures()
-                
                 # AI's turn if game is not over
                 if not self.game_over:
-                    self.ai_make_move()
+                    self.schedule_ai_move()
+    
+    def schedule_ai_move(self):
+        """Let the AI move after a short delay without blocking the event loop"""
+        pygame.time.set_timer(AI_MOVE_EVENT, self.AI_MOVE_DELAY_MS, loops=1)
     
     def ai_make_move(self):
         """Let the AI make a move"""
-        # Add a small delay to make the AI's move visible
-        pygame.display.update()
-        time.sleep(0.5)
+        # Ignore a timer left over from a game that has since been restarted
+        if self.game_over or self.current_player != self.ai_symbol:
+            return
         
         # AI makes its move
         move = self.agent.get_best_move(self.state, self.ai_symbol)
         self.state = self.game.get_next_state(self.state, move)
         self.current_player = -self.current_player
+        self.dirty = True
         
         # Check if game is over
         self.check_game_over()
-        
-        # Draw the updated board
-        self.draw_figures()
     
     def check_game_over(self):
         """Check if the game is over and update game status"""
         if self.game.is_terminal_state(self.state):
             self.game_over = True
             self.winner = self.game.get_winner(self.state)
+            self.dirty = True
         
     def display_result(self):
         """Display the game result"""
@@ -172,38 +189,28 @@ class TicTacToeGUI:
         pygame.draw.rect(self.screen, self.LIGHT_YELLOW, 
                         (box_x, box_y, box_width, box_height), 0, 10)
         
-        # Prepare text with bold font
-        title_font = pygame.font.SysFont(None, 60, bold=True)
-        
         # Display result
         if self.winner == self.player_symbol:
-            result_text = "You Won!"
-            text_color = self.GREEN
+            text = self._surf_win
         elif self.winner == self.ai_symbol:
-            result_text = "AI Won!"
-            text_color = self.RED
+            text = self._surf_loss
         else:
-            result_text = "It's a Draw!"
-            text_color = self.BLACK
+            text = self._surf_draw
         
-        # Only render the main text, no shadow
-        text = title_font.render(result_text, True, text_color)
+        # Only draw the main text, no shadow
         text_rect = text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2 - 20))
         self.screen.blit(text, text_rect)
         
         # Display restart instructions with improved visibility
-        restart_font = pygame.font.SysFont(None, 36)
-        restart_text = restart_font.render("Press R to restart or Q to quit", True, self.DARK_BLUE)
-        restart_rect = restart_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2 + 30))
-        self.screen.blit(restart_text, restart_rect)
-        
-        # Update display immediately to show the message box
-        pygame.display.update()
+        restart_rect = self._surf_restart.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2 + 30))
+        self.screen.blit(self._surf_restart, restart_rect)
     
     def restart_game(self, player_first=None):
         """Restart the game"""
         # Reset the game state
+        pygame.time.set_timer(AI_MOVE_EVENT, 0)  # Cancel a pending AI move
         self.state = self.game.get_initial_state()
+        self.agent.reset()
         self.current_player = 1  # X always starts
         
         # Update player symbols if specified
@@ -214,18 +221,30 @@ class TicTacToeGUI:
         # Reset game status
         self.game_over = False
         self.winner = None
-        
-        # Clear the screen and redraw the board
-        self.screen.fill(self.BG_COLOR)
-        self.draw_lines()
+        self.dirty = True
         
         # AI makes first move if player is second
         if self.player_symbol == -1:
-            self.ai_make_move()
+            self.schedule_ai_move()
     
     def run(self):
         while True:
-            for event in pygame.event.get():
+            # Redraw board and pieces only when something changed
+            if self.dirty:
+                self.screen.blit(self._board_surface, (0, 0))
+                self.draw_figures()
+                # Draw result box last if game is over
+                if self.game_over:
+                    self.display_result()
+                pygame.display.update()
+                self.dirty = False
+            
+            # Block until there is input, then handle everything queued
+            for event in [pygame.event.wait()] + pygame.event.get():
+                if event.type == pygame.VIDEOEXPOSE:
+                    self.dirty = True
+                if event.type == AI_MOVE_EVENT:
+                    self.ai_make_move()
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -245,14 +264,6 @@ class TicTacToeGUI:
                     elif event.key == pygame.K_q:
                         pygame.quit()
                         sys.exit()
-            # Always redraw board and pieces
-            self.screen.fill(self.BG_COLOR)
-            self.draw_lines()
-            self.draw_figures()
-            # Draw result box last if game is over
-            if self.game_over:
-                self.display_result()
-            pygame.display.update()
 
 
 def main():
@@ -69,13 +69,14 @@ def get_player_move(game: Game, state: Any) -> Any:
     
     if isinstance(game, TicTacToe):
         # Format for TicTacToe: row, col
+        legal_set = set(legal_moves)  # Built once, reused across retries
         while True:
             try:
                 move_input = input("Enter your move as 'row,col' (e.g., '1,2'): ")
                 row, col = map(int, move_input.split(','))
                 move = (row, col)
                 
-                if move in legal_moves:
+                if move in legal_set:
                     return move
                 else:
                     print("Invalid move! Please try again.")
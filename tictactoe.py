@@ -1,7 +1,181 @@
-import numpy as np
-from typing import List, Tuple, Optional, Any
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Optional
 from game import Game
 
+# A state is a pair of bitboards (x_bb, o_bb); bit row * board_size + col
+# is set when that player has a mark on the cell.
+State = Tuple[int, int]
+
+# Index of the inverse of each symmetry built by _symmetries
+INVERSE_SYMMETRY = (0, 3, 2, 1, 4, 5, 6, 7)
+
+
+def _submasks(mask: int) -> List[int]:
+    """Return every subset of the bits in mask, from mask itself down to 0."""
+    subsets = []
+    sub = mask
+    while True:
+        subsets.append(sub)
+        if sub == 0:
+            return subsets
+        sub = (sub - 1) & mask
+
+
+@lru_cache(maxsize=None)
+def _win_masks(board_size: int) -> Tuple[int, ...]:
+    """Return one bitmask per row, column and diagonal of the board."""
+    n = board_size
+    lines = []
+    for i in range(n):
+        lines.append([i * n + j for j in range(n)])  # Row i
+        lines.append([j * n + i for j in range(n)])  # Column i
+    lines.append([i * n + i for i in range(n)])
+    lines.append([i * n + (n - 1 - i) for i in range(n)])
+    return tuple(sum(1 << cell for cell in line) for line in lines)
+
+
+@lru_cache(maxsize=8192)
+def _is_win(bb: int, board_size: int) -> bool:
+    """Return True if the bitboard covers a complete line."""
+    return any((bb & mask) == mask for mask in _win_masks(board_size))
+
+
+@lru_cache(maxsize=None)
+def _move_order(board_size: int) -> Tuple[int, ...]:
+    """
+    Return every cell index, most promising first.
+
+    Cells are ranked by how many lines pass through them, which on a 3x3
+    board puts the centre first, then the corners, then the edges. Trying
+    strong moves first lets alpha-beta prune far more of the tree.
+    """
+    n = board_size
+
+    def lines_through(cell: int) -> int:
+        row, col = divmod(cell, n)
+        return 2 + (row == col) + (row + col == n - 1)
+
+    return tuple(sorted(range(n * n), key=lambda cell: -lines_through(cell)))
+
+
+@lru_cache(maxsize=8192)
+def _legal_moves(occ: int, board_size: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Return the empty cells of a board as (row, col) moves, in _move_order.
+
+    Cached on the occupancy bitboard, so every position with the same filled
+    cells shares one immutable tuple.
+    """
+    return tuple(divmod(cell, board_size) for cell in _move_order(board_size)
+                 if not (occ >> cell) & 1)
+
+
+@lru_cache(maxsize=None)
+def _symmetries(board_size: int) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    Precompute the 8 rotations and reflections of the board.
+
+    Returns:
+        For each symmetry, one table per row mapping that row's bits to the
+        bits they occupy after the transform, so a whole bitboard is
+        remapped with one lookup per row.
+    """
+    n = board_size
+    transforms = (
+        lambda r, c: (r, c),                  # Identity
+        lambda r, c: (c, n - 1 - r),          # Rotate 90
+        lambda r, c: (n - 1 - r, n - 1 - c),  # Rotate 180
+        lambda r, c: (n - 1 - c, r),          # Rotate 270
+        lambda r, c: (r, n - 1 - c),          # Mirror left-right
+        lambda r, c: (n - 1 - r, c),          # Mirror top-bottom
+        lambda r, c: (c, r),                  # Main diagonal
+        lambda r, c: (n - 1 - c, n - 1 - r),  # Anti-diagonal
+    )
+    symmetries = []
+    for transform in transforms:
+        row_tables = []
+        for r in range(n):
+            table = []
+            for bits in range(1 << n):
+                mapped = 0
+                for c in range(n):
+                    if (bits >> c) & 1:
+                        tr, tc = transform(r, c)
+                        mapped |= 1 << (tr * n + tc)
+                table.append(mapped)
+            row_tables.append(tuple(table))
+        symmetries.append(tuple(row_tables))
+    return tuple(symmetries)
+
+
+def _apply_symmetry(bb: int, symmetry: int, board_size: int) -> int:
+    """Return the bitboard transformed by the given symmetry."""
+    row_mask = (1 << board_size) - 1
+    mapped = 0
+    for table in _symmetries(board_size)[symmetry]:
+        mapped |= table[bb & row_mask]
+        bb >>= board_size
+    return mapped
+
+
+@lru_cache(maxsize=8192)
+def _canonical_state(x_bb: int, o_bb: int, board_size: int) -> Tuple[State, int]:
+    """Return (canonical state, symmetry) for TicTacToe.get_canonical_state."""
+    canonical, best_symmetry = (x_bb, o_bb), 0
+    for symmetry in range(1, len(_symmetries(board_size))):
+        candidate = (_apply_symmetry(x_bb, symmetry, board_size),
+                     _apply_symmetry(o_bb, symmetry, board_size))
+        if candidate < canonical:
+            canonical, best_symmetry = candidate, symmetry
+    return canonical, best_symmetry
+
+
+def solve_tictactoe(game: 'TicTacToe') -> Dict[Tuple[int, int, int], Tuple[float, Any]]:
+    """
+    Solve Tic-Tac-Toe by exhaustive negamax from the empty board.
+
+    Args:
+        game: The game to solve
+
+    Returns:
+        A dict mapping (x_bb, o_bb, player to move) for every reachable
+        non-terminal position to (value, best move), with the value from the
+        perspective of the player to move
+    """
+    optimal = {}
+
+    def negamax(state: Any, player: int) -> float:
+        key = (state[0], state[1], player)
+        if key in optimal:
+            return optimal[key][0]
+
+        best_value = float('-inf')
+        best_move = None
+        for move in game.get_legal_moves(state):
+            next_state = game.get_next_state(state, move)
+            winner = game.get_winner(next_state)
+            if winner is None:
+                value = -negamax(next_state, -player)
+            else:
+                value = 1000.0 * winner * player
+
+            if value > best_value:
+                best_value = value
+                best_move = move
+
+        optimal[key] = (best_value, best_move)
+        return best_value
+
+    negamax(game.get_initial_state(), 1)
+    return optimal
+
+
+@lru_cache(maxsize=1)
+def solved_tictactoe() -> Dict[Tuple[int, int, int], Tuple[float, Any]]:
+    """Return the solved 3x3 game table, solving it on the first call in each process."""
+    return solve_tictactoe(TicTacToe())
+
+
 class TicTacToe(Game):
     """Implementation of Tic-Tac-Toe game."""
     
@@ -13,21 +187,53 @@ class TicTacToe(Game):
             board_size: Size of the board (board_size x board_size)
         """
         self.board_size = board_size
+        self.num_cells = board_size * board_size
+        self.full_mask = (1 << self.num_cells) - 1
+        self.win_masks = _win_masks(board_size)
+        self.line_scores = self._build_line_scores()
+    
+    def _build_line_scores(self) -> Tuple[Tuple[int, Dict[int, int]], ...]:
+        """
+        Precompute each line's contribution to evaluate().
+        
+        Returns:
+            One (mask, table) pair per line. Both apply to the combined board
+            x_bb | (o_bb << num_cells); the table maps the masked board to the
+            line's score from X's perspective.
+        """
+        line_scores = []
+        for mask in self.win_masks:
+            table = {}
+            for x_line in _submasks(mask):
+                for o_line in _submasks(mask & ~x_line):
+                    score = 0
+                    if not o_line:
+                        score += 10 ** bin(x_line).count('1')
+                    if not x_line:
+                        score -= 10 ** bin(o_line).count('1')
+                    table[x_line | (o_line << self.num_cells)] = score
+            line_scores.append((mask | (mask << self.num_cells), table))
+        return tuple(line_scores)
     
-    def get_initial_state(self) -> np.ndarray:
+    def get_initial_state(self) -> State:
         """Return the initial empty board state."""
-        return np.zeros((self.board_size, self.board_size), dtype=int)
+        return (0, 0)
+    
+    def get_cell(self, state: State, row: int, col: int) -> int:
+        """Return the mark on a cell: 1 for X, -1 for O, 0 if empty."""
+        bit = 1 << (row * self.board_size + col)
+        if state[0] & bit:
+            return 1
+        if state[1] & bit:
+            return -1
+        return 0
     
-    def get_legal_moves(self, state: np.ndarray) -> List[Tuple[int, int]]:
-        """Return a list of legal moves (empty cells) as (row, col) coordinates."""
-        legal_moves = []
-        for i in range(self.board_size):
-            for j in range(self.board_size):
-                if state[i, j] == 0:
-                    legal_moves.append((i, j))
-        return legal_moves
+    def get_legal_moves(self, state: State) -> Tuple[Tuple[int, int], ...]:
+        """Return the legal moves (empty cells) as (row, col) coordinates."""
+        x_bb, o_bb = state
+        return _legal_moves(x_bb | o_bb, self.board_size)
     
-    def get_next_state(self, state: np.ndarray, move: Tuple[int, int]) -> np.ndarray:
+    def get_next_state(self, state: State, move: Tuple[int, int]) -> State:
         """
         Return the state after making the move.
         
@@ -39,102 +245,78 @@ class TicTacToe(Game):
             New board state after the move
         """
         row, col = move
-        # Determine whose turn it is by counting pieces
-        pieces = np.sum(np.abs(state))
-        player = 1 if pieces % 2 == 0 else -1
+        x_bb, o_bb = state
+        bit = 1 << (row * self.board_size + col)
         
-        # Create a copy of the state to avoid modifying the original
-        new_state = state.copy()
-        new_state[row, col] = player
-        return new_state
+        # Determine whose turn it is by counting pieces
+        pieces = bin(x_bb | o_bb).count('1')
+        if pieces % 2 == 0:
+            return (x_bb | bit, o_bb)
+        return (x_bb, o_bb | bit)
     
-    def is_terminal_state(self, state: np.ndarray) -> bool:
+    def is_terminal_state(self, state: State) -> bool:
         """Check if the game is over (someone won or board is full)."""
         return self.get_winner(state) is not None
     
-    def get_winner(self, state: np.ndarray) -> Optional[int]:
+    def get_winner(self, state: State) -> Optional[int]:
         """
         Return the winner of the game (1, -1, 0 for draw, None if game not over).
         """
-        # Check rows
-        for i in range(self.board_size):
-            row_sum = np.sum(state[i, :])
-            if abs(row_sum) == self.board_size:
-                return 1 if row_sum > 0 else -1
-                
-        # Check columns
-        for i in range(self.board_size):
-            col_sum = np.sum(state[:, i])
-            if abs(col_sum) == self.board_size:
-                return 1 if col_sum > 0 else -1
-                
-        # Check diagonals
-        diag1_sum = np.sum(np.diag(state))
-        if abs(diag1_sum) == self.board_size:
-            return 1 if diag1_sum > 0 else -1
-            
-        diag2_sum = np.sum(np.diag(np.fliplr(state)))
-        if abs(diag2_sum) == self.board_size:
-            return 1 if diag2_sum > 0 else -1
+        x_bb, o_bb = state
+        if _is_win(x_bb, self.board_size):
+            return 1
+        if _is_win(o_bb, self.board_size):
+            return -1
             
         # Check for draw (full board)
-        if len(self.get_legal_moves(state)) == 0:
+        if (x_bb | o_bb) == self.full_mask:
             return 0  # Draw
             
         # Game not over
         return None
     
-    def evaluate(self, state: np.ndarray, player: int) -> float:
+    def evaluate(self, state: State, player: int) -> float:
         """
         Evaluate the board from player's perspective.
         This is a simple heuristic for Tic-Tac-Toe that counts the number
         of potential winning lines.
         """
+        x_bb, o_bb = state
+        board = x_bb | (o_bb << self.num_cells)
         score = 0
-        opponent = -player
         
-        # Check rows
-        for i in range(self.board_size):
-            row = state[i, :]
-            if opponent not in row:
-                score += 10 ** np.sum(row == player)
-            if player not in row:
-                score -= 10 ** np.sum(row == opponent)
-                
-        # Check columns
-        for i in range(self.board_size):
-            col = state[:, i]
-            if opponent not in col:
-                score += 10 ** np.sum(col == player)
-            if player not in col:
-                score -= 10 ** np.sum(col == opponent)
-                
-        # Check diagonals
-        diag1 = np.diag(state)
-        if opponent not in diag1:
-            score += 10 ** np.sum(diag1 == player)
-        if player not in diag1:
-            score -= 10 ** np.sum(diag1 == opponent)
-            
-        diag2 = np.diag(np.fliplr(state))
-        if opponent not in diag2:
-            score += 10 ** np.sum(diag2 == player)
-        if player not in diag2:
-            score -= 10 ** np.sum(diag2 == opponent)
+        # Rows, columns and diagonals, scored for X by table lookup
+        for mask, table in self.line_scores:
+            score += table[board & mask]
             
-        return score
+        return score if player == 1 else -score
+    
+    def get_canonical_state(self, state: State) -> Tuple[State, int]:
+        """
+        Return the smallest of the state's 8 rotations and reflections.
+        
+        Returns:
+            (canonical state, symmetry) where symmetry is the index of the
+            transform that maps state onto the canonical state
+        """
+        x_bb, o_bb = state
+        return _canonical_state(x_bb, o_bb, self.board_size)
+    
+    def transform_move(self, move: Tuple[int, int], symmetry: int, inverse: bool = False) -> Tuple[int, int]:
+        """Map a (row, col) move through a symmetry, or back through its inverse."""
+        if inverse:
+            symmetry = INVERSE_SYMMETRY[symmetry]
+        row, col = move
+        mapped = _apply_symmetry(1 << (row * self.board_size + col), symmetry, self.board_size)
+        return divmod(mapped.bit_length() - 1, self.board_size)
     
-    def print_state(self, state: np.ndarray) -> None:
+    def print_state(self, state: State) -> None:
         """Print a human-readable representation of the board."""
         symbols = {0: ' ', 1: 'X', -1: 'O'}
+        separator = "\n  " + "-" * (2 * self.board_size - 1) + "\n"
         
-        print("  " + " ".join(str(i) for i in range(self.board_size)))
-        for i in range(self.board_size):
-            print(f"{i} ", end="")
-            for j in range(self.board_size):
-                print(symbols[state[i, j]], end="")
-                if j < self.board_size - 1:
-                    print("|", end="")
-            print()
-            if i < self.board_size - 1:
-                print("  " + "-".join(["-" for _ in range(self.board_size)]))
\ No newline at end of file
+        # Build the whole board as one string and print it once
+        header = "  " + " ".join(str(i) for i in range(self.board_size)) + "\n"
+        rows = [f"{i} " + "|".join(symbols[self.get_cell(state, i, j)] for j in range(self.board_size))
+                for i in range(self.board_size)]
+        print(header + separator.join(rows))